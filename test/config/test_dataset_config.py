@@ -6,6 +6,7 @@ from pydantic import ValidationError
 from pathlib import Path
 
 from tsdat.config.dataset import DatasetConfig
+from tsdat.config import utils as config_utils
 from tsdat.config.attributes import GlobalAttributes, AttributeModel
 from tsdat.config.variables import (
     VariableAttributes,
@@ -33,6 +34,12 @@ def test_fail_if_non_ascii_attrs():
         assert expected_error_msg in actual_msg
 
 
+def test_skip_ascii_validation_with_env_var(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TSDAT_SKIP_ASCII_VALIDATION", "1")
+    attrs = AttributeModel(**{"measurement": "ºC"})
+    assert model_to_dict(attrs) == {"measurement": "ºC"}
+
+
 def test_fail_if_missing_required_global_attributes():
     attrs: Dict[str, Any] = {}
     expected_error_msgs = [
@@ -131,6 +138,34 @@ def test_valid_model_adds_global_attributes():
     assert model_dict["code_version"] not in ["", "N/A"]
 
 
+def test_code_version_from_git_is_cached(monkeypatch: pytest.MonkeyPatch):
+    git_lookups: List[int] = []
+
+    class FakeVersion:
+        @classmethod
+        def from_git(cls) -> "FakeVersion":
+            git_lookups.append(1)
+            return cls()
+
+        def serialize(self, **kwargs: Any) -> str:
+            return "1.2.3"
+
+    monkeypatch.delenv("CODE_VERSION", raising=False)
+    monkeypatch.setattr(config_utils, "Version", FakeVersion)
+    config_utils._get_code_version_from_git.cache_clear()  # type: ignore
+    try:
+        assert config_utils.get_code_version() == "1.2.3"
+        assert config_utils.get_code_version() == "1.2.3"
+        assert len(git_lookups) == 1
+
+        # The environment variable still takes effect after the git lookup is cached
+        monkeypatch.setenv("CODE_VERSION", "4.5.6")
+        assert config_utils.get_code_version() == "4.5.6"
+        assert len(git_lookups) == 1
+    finally:
+        config_utils._get_code_version_from_git.cache_clear()  # type: ignore
+
+
 def test_global_attributes_allow_extra():
     attrs: Dict[Any, Any] = {
         "title": "Valid Title",
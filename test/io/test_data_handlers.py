@@ -6,6 +6,7 @@ import xarray as xr
 from datetime import datetime
 from pathlib import Path
 import pytest
+from pydantic import ValidationError
 from pandas.testing import assert_frame_equal
 from tsdat.io.base import DataReader, FileHandler
 from tsdat.testing import assert_close
@@ -243,6 +244,42 @@ def test_zarr_writer(sample_dataset: xr.Dataset):
     tmp_dir.cleanup()
 
 
+def test_zarr_writer_time_chunks(sample_2D_dataset: xr.Dataset):
+    expected = sample_2D_dataset.copy(deep=True)  # type: ignore
+    writer = ZarrWriter(parameters={"time_chunk_mb": 1e-5})  # ~10 bytes
+    tmp_dir = tempfile.TemporaryDirectory()
+
+    tmp_file = Path(tmp_dir.name) / "test_writer.zarr"
+    writer.write(sample_2D_dataset, tmp_file)
+    dataset: xr.Dataset = xr.open_zarr(tmp_file)  # type: ignore
+    assert_close(dataset, expected, check_fill_value=False)
+    assert dataset["Second Data Var"].encoding["chunks"] == (1, 3)
+    assert dataset["time"].encoding["chunks"] == (1,)
+
+    tmp_dir.cleanup()
+
+
+def test_zarr_writer_time_chunks_dask(sample_2D_dataset: xr.Dataset):
+    expected = sample_2D_dataset.copy(deep=True)  # type: ignore
+    dask_dataset = sample_2D_dataset.chunk({"time": 2, "height": 2})  # type: ignore
+    writer = ZarrWriter(parameters={"time_chunk_mb": 1e-5})  # ~10 bytes
+    tmp_dir = tempfile.TemporaryDirectory()
+
+    tmp_file = Path(tmp_dir.name) / "test_writer.zarr"
+    writer.write(dask_dataset, tmp_file)
+    dataset: xr.Dataset = xr.open_zarr(tmp_file)  # type: ignore
+    assert_close(dataset, expected, check_fill_value=False)
+    assert dataset["Second Data Var"].encoding["chunks"] == (1, 3)
+    assert dask_dataset["Second Data Var"].chunks == ((2, 1), (2, 1))  # not modified
+
+    tmp_dir.cleanup()
+
+
+def test_zarr_writer_rejects_non_positive_time_chunks():
+    with pytest.raises(ValidationError):
+        ZarrWriter(parameters={"time_chunk_mb": -1})
+
+
 @pytest.mark.parametrize(
     "handler_class, output_key",
     [
@@ -1,8 +1,12 @@
+import os
+import re
 import warnings
+from itertools import chain
 from typing import Any, Dict, Optional
 
 from pydantic import (
     BaseModel,
+    ConstrainedStr,
     Extra,
     Field,
     HttpUrl,
@@ -15,12 +19,49 @@ from pydantic.fields import ModelField
 from ..utils import get_datastream
 from .utils import get_code_version
 
+_ALPHANUMERIC_REGEX = re.compile(r"^[a-zA-Z0-9_]+$", re.ASCII)  # alphanumeric and '_'
+_LOWER_ALPHANUMERIC_REGEX = re.compile(r"^[a-z0-9_]+$", re.ASCII)  # lowercase and '_'
+_TEMPORAL_REGEX = re.compile(r"^[0-9]+[a-zA-Z]+$", re.ASCII)  # e.g., '10m'
+_DATA_LEVEL_REGEX = re.compile(r"^[a-z0-9]+$", re.ASCII)  # lowercase alphanumeric
+
+
+# Constrained string types are built once at import time and reused as annotations
+class AlphanumericStr(ConstrainedStr):
+    min_length = 1
+    regex = _ALPHANUMERIC_REGEX
+
+
+class DatasetNameStr(ConstrainedStr):
+    min_length = 2
+    regex = _LOWER_ALPHANUMERIC_REGEX
+
+
+class TemporalStr(ConstrainedStr):
+    min_length = 2
+    regex = _TEMPORAL_REGEX
+
+
+class DataLevelStr(ConstrainedStr):
+    min_length = 2
+    max_length = 3
+    regex = _DATA_LEVEL_REGEX
+
 
 class AttributeModel(BaseModel, extra=Extra.allow):
     # HACK: root is needed for now: https://github.com/samuelcolvin/pydantic/issues/515
     @root_validator(skip_on_failure=True)
     @classmethod
     def validate_all_ascii(cls, values: Dict[Any, Any]) -> Dict[str, str]:
+        # Users with known-good configs can opt out of this check entirely
+        if os.environ.get("TSDAT_SKIP_ASCII_VALIDATION"):
+            return values
+        # Check everything with one str.isascii() call and only walk the attributes one
+        # at a time to find the offending entry if that check fails.
+        strings = (value for value in values.values() if isinstance(value, str))
+        if all(isinstance(key, str) for key in values) and (
+            "".join(chain(values, strings)).isascii()
+        ):
+            return values
         for key, value in values.items():
             if not isinstance(key, str) or not key.isascii():
                 raise ValueError(f"'{key}' contains a non-ascii character.")
@@ -77,37 +118,29 @@ class GlobalAttributes(AttributeModel):
             "Optional attribute used to cite other data, algorithms, etc. as needed."
         ),
     )
-    location_id: str = Field(
-        min_length=1,
-        regex=r"^[a-zA-Z0-9_]+$",  # alphanumeric and '_' characters
+    location_id: AlphanumericStr = Field(
         description=(
             "A label or acronym for the location where the data were obtained"
             " from. Only alphanumeric characters and '_' are allowed."
         ),
     )
-    dataset_name: str = Field(
-        min_length=2,
-        regex=r"^[a-z0-9_]+$",  # lowercase alphanumeric and '_' characters
+    dataset_name: DatasetNameStr = Field(
         description=(
             "A string used to identify the data being produced. Ideally"
             " resembles a shortened lowercase version of the title. Only lowercase"
             " alphanumeric characters and '_' are allowed."
         ),
     )
-    qualifier: Optional[str] = Field(
+    qualifier: Optional[AlphanumericStr] = Field(
         default=None,
-        min_length=1,
-        regex=r"^[a-zA-Z0-9_]+$",  # lowercase alphanumeric and '_' characters
         description=(
             "An optional string which distinguishes these data from other"
             " datasets produced by the same instrument. Only alphanumeric characters"
             " and '_' are allowed."
         ),
     )
-    temporal: Optional[str] = Field(
+    temporal: Optional[TemporalStr] = Field(
         default=None,
-        min_length=2,
-        regex=r"^[0-9]+[a-zA-Z]+$",
         description=(
             "An optional string which describes the temporal resolution of the data (if"
             " spaced in regular intervals). This string should be formatted as a number"
@@ -116,10 +149,7 @@ class GlobalAttributes(AttributeModel):
             " allowed."
         ),
     )
-    data_level: str = Field(
-        min_length=2,
-        max_length=3,
-        regex=r"^[a-z0-9]+$",  # lowercase alphanumeric characters
+    data_level: DataLevelStr = Field(
         description=(
             "A string used to indicate the level of processing of the output data. It"
             " should be formatted as a letter followed by a number. Typical values for"
@@ -182,5 +212,11 @@ class GlobalAttributes(AttributeModel):
     @classmethod
     def add_datastream_field(cls, values: Dict[str, StrictStr]) -> Dict[str, StrictStr]:
         if not values["datastream"]:
-            values["datastream"] = get_datastream(**values)
+            values["datastream"] = get_datastream(
+                location_id=values["location_id"],
+                dataset_name=values["dataset_name"],
+                qualifier=values.get("qualifier"),
+                temporal=values.get("temporal"),
+                data_level=values["data_level"],
+            )
         return values
@@ -1,6 +1,7 @@
 import os
 import yaml
 import warnings
+from functools import lru_cache
 from jsonpointer import set_pointer  # type: ignore
 from dunamai import Style, Version
 from pathlib import Path
@@ -246,17 +247,23 @@ def read_yaml(filepath: Path) -> Dict[Any, Any]:
 
 
 def get_code_version() -> str:
-    version = "N/A"
     try:
-        version = os.environ["CODE_VERSION"]
+        return os.environ["CODE_VERSION"]
     except KeyError:
-        try:
-            version = Version.from_git().serialize(dirty=True, style=Style.SemVer)
-        except RuntimeError:
-            warnings.warn(
-                "Could not get code_version from either the 'CODE_VERSION' environment"
-                " variable nor from git history. The 'code_version' global attribute"
-                " will be set to 'N/A'.",
-                RuntimeWarning,
-            )
+        return _get_code_version_from_git()
+
+
+@lru_cache(maxsize=1)
+def _get_code_version_from_git() -> str:
+    # Parsing the git history shells out to git, so only do it once per process.
+    version = "N/A"
+    try:
+        version = Version.from_git().serialize(dirty=True, style=Style.SemVer)
+    except RuntimeError:
+        warnings.warn(
+            "Could not get code_version from either the 'CODE_VERSION' environment"
+            " variable nor from git history. The 'code_version' global attribute"
+            " will be set to 'N/A'.",
+            RuntimeWarning,
+        )
     return version
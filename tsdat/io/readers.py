@@ -22,6 +22,18 @@ class NetCDFReader(DataReader):
     Thin wrapper around xarray's `open_dataset()` function, with optional parameters
     used as keyword arguments in the function call.
 
+    For large inputs it can help to open files lazily with chunks matching the chunking
+    used on disk, which xarray does when `chunks` is an empty mapping (requires dask):
+
+    .. code-block:: yaml
+
+        readers:
+          .*:
+            classname: tsdat.io.readers.NetCDFReader
+            parameters:
+              chunks: {}
+              engine: h5netcdf
+
     ---------------------------------------------------------------------------------"""
 
     parameters: Dict[str, Any] = {}
@@ -3,9 +3,9 @@ import warnings
 import numpy as np
 import pandas as pd
 import xarray as xr
-from typing import Any, Dict, Iterable, List, Optional, cast, Hashable
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast, Hashable
 from pathlib import Path
-from pydantic import BaseModel, Extra, Field
+from pydantic import BaseModel, Extra, Field, PositiveFloat
 from .base import FileWriter
 from ..utils import get_filename
 
@@ -266,12 +266,18 @@ class ZarrWriter(FileWriter):
     """---------------------------------------------------------------------------------
     Writes the dataset to a basic zarr archive.
 
-    Advanced features such as specifying the chunk size or writing the zarr archive in
-    AWS S3 will be implemented later.
+    Variables with a `time` dimension can be chunked along time by setting the
+    `time_chunk_mb` parameter; other dimensions are always kept in a single chunk so
+    that time slices can be read independently. Writing the zarr archive in AWS S3 will
+    be implemented later.
 
     ---------------------------------------------------------------------------------"""
 
     class Parameters(BaseModel, extra=Extra.forbid):
+        time_chunk_mb: Optional[PositiveFloat] = None
+        """Approximate size (in MB) of each chunk along the time dimension. If not set,
+        chunk sizes are chosen by xarray and zarr."""
+
         to_zarr_kwargs: Dict[str, Any] = {}
 
     parameters: Parameters = Field(default_factory=Parameters)
@@ -281,6 +287,7 @@ class ZarrWriter(FileWriter):
         self, dataset: xr.Dataset, filepath: Optional[Path] = None, **kwargs: Any
     ) -> None:
         encoding_dict: Dict[str, Dict[str, Any]] = {}
+        rechunked: Dict[str, xr.Variable] = {}
         for variable_name in cast(Iterable[str], dataset.variables):
             # Prevent Xarray from setting 'nan' as the default _FillValue
             encoding_dict[variable_name] = dataset[variable_name].encoding  # type: ignore
@@ -290,8 +297,39 @@ class ZarrWriter(FileWriter):
             ):
                 encoding_dict[variable_name]["_FillValue"] = None
 
+            if self.parameters.time_chunk_mb and "time" in dataset[variable_name].dims:
+                chunks = self._get_time_chunks(
+                    dataset[variable_name], self.parameters.time_chunk_mb
+                )
+                # Copy so the chunks don't leak into the dataset's own encoding
+                encoding_dict[variable_name] = dict(
+                    encoding_dict[variable_name], chunks=chunks
+                )
+                # Dask chunks must line up with the zarr chunks or to_zarr will fail
+                variable = dataset[variable_name].variable
+                if variable.chunks is not None:
+                    rechunked[variable_name] = variable.chunk(
+                        dict(zip(variable.dims, chunks))
+                    )
+
+        if rechunked:
+            dataset = dataset.copy()
+            for variable_name, variable in rechunked.items():
+                dataset[variable_name] = variable
+
         dataset.to_zarr(
             filepath,
             encoding=encoding_dict,
             **self.parameters.to_zarr_kwargs,
         )  # type: ignore
+
+    @staticmethod
+    def _get_time_chunks(data_array: xr.DataArray, chunk_mb: float) -> Tuple[int, ...]:
+        slice_bytes = data_array.dtype.itemsize * int(
+            np.prod([n for d, n in data_array.sizes.items() if d != "time"])
+        )
+        time_chunk = int(chunk_mb * 1024 * 1024 // max(slice_bytes, 1))
+        time_chunk = max(min(time_chunk, data_array.sizes["time"]), 1)
+        return tuple(
+            time_chunk if d == "time" else n for d, n in data_array.sizes.items()
+        )
@@ -97,7 +97,7 @@ class Pipeline(ParameterizedClass, ABC):
                 # cast to specified data type. Note that np.array preserves scalars
                 data = np.array(data, dtype=dtype)  # type: ignore
 
-            dataset[name] = xr.DataArray(data=data, dims=dims)
+            dataset[name] = (dims, data)  # cheaper than building an xr.DataArray
         return dataset
 
     def _add_dataset_dtypes(self, dataset: xr.Dataset) -> xr.Dataset:
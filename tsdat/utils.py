@@ -46,18 +46,21 @@ def datetime_substitutions(
     substitutions: Dict[str, str] = {}
     if time is not None:
         t = pd.to_datetime(time)
+        # Format once and reuse the pieces rather than calling strftime per field
+        year, month, day, hour, minute, second = t.strftime("%Y %m %d %H %M %S").split()
+        date, time_str = year + month + day, hour + minute + second
         substitutions.update(
-            year=t.strftime("%Y"),
-            month=t.strftime("%m"),
-            day=t.strftime("%d"),
-            hour=t.strftime("%H"),
-            minute=t.strftime("%M"),
-            second=t.strftime("%S"),
-            date_time=t.strftime("%Y%m%d.%H%M%S"),
-            date=t.strftime("%Y%m%d"),
-            time=t.strftime("%H%M%S"),
-            start_date=t.strftime("%Y%m%d"),  # included for backwards compatibility
-            start_time=t.strftime("%H%M%S"),  # included for backwards compatibility
+            year=year,
+            month=month,
+            day=day,
+            hour=hour,
+            minute=minute,
+            second=second,
+            date_time=f"{date}.{time_str}",
+            date=date,
+            time=time_str,
+            start_date=date,  # included for backwards compatibility
+            start_time=time_str,  # included for backwards compatibility
         )
     return substitutions
 
@@ -262,7 +265,7 @@ def get_file_datetime_str(file: Union[Path, str]) -> str:
     return ""
 
 
-def get_datastream(**global_attrs: str) -> str:
+def get_datastream(**global_attrs: Optional[str]) -> str:
     return DATASTREAM_TEMPLATE.substitute(global_attrs)
 
 